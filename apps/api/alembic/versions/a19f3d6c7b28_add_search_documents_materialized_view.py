@@ -0,0 +1,78 @@
+"""Add search_documents materialized view unioning searchable entities"""
+
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "a19f3d6c7b28"
+down_revision: str | None = "e8b52c90d1f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW search_documents AS
+        SELECT
+            'article' AS entity_type,
+            a.id AS entity_id,
+            a.title AS title,
+            a.summary AS content,
+            a.tags AS tags,
+            a.search_vector AS search_vector,
+            a.published_at AS published_at,
+            a.view_count AS popularity
+        FROM articles a
+        WHERE a.status = 'published'
+        UNION ALL
+        SELECT
+            'space',
+            s.id,
+            s.name,
+            s.description,
+            s.tags,
+            s.search_vector,
+            s.created_at,
+            s.member_count
+        FROM spaces s
+        WHERE s.visibility = 'public'
+        UNION ALL
+        SELECT
+            'user',
+            u.id,
+            COALESCE(u.display_name, u.email),
+            u.bio,
+            u.expertise_tags,
+            u.search_vector,
+            u.created_at,
+            0
+        FROM users u
+        """
+    )
+
+    # Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        "idx_search_documents_entity",
+        "search_documents",
+        ["entity_type", "entity_id"],
+        unique=True,
+    )
+    op.create_index(
+        "idx_search_documents_vector",
+        "search_documents",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "idx_search_documents_tags",
+        "search_documents",
+        ["tags"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS search_documents")
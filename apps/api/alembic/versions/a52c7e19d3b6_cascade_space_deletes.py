@@ -0,0 +1,64 @@
+"""Cascade space deletes to members and shared articles"""
+
+from typing import Sequence
+
+from alembic import op
+
+
+revision: str = "a52c7e19d3b6"
+down_revision: str | None = "f2a8b5d94e61"
+branch_labels: str | Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Deleting a space previously left membership and share rows for the
+    # ORM to chase; cascading at the database level removes them in the
+    # same statement as the parent delete
+    op.drop_constraint(
+        "space_members_space_id_fkey", "space_members", type_="foreignkey"
+    )
+    op.create_foreign_key(
+        "space_members_space_id_fkey",
+        "space_members",
+        "spaces",
+        ["space_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+    op.drop_constraint(
+        "space_articles_space_id_fkey", "space_articles", type_="foreignkey"
+    )
+    op.create_foreign_key(
+        "space_articles_space_id_fkey",
+        "space_articles",
+        "spaces",
+        ["space_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "space_articles_space_id_fkey", "space_articles", type_="foreignkey"
+    )
+    op.create_foreign_key(
+        "space_articles_space_id_fkey",
+        "space_articles",
+        "spaces",
+        ["space_id"],
+        ["id"],
+    )
+
+    op.drop_constraint(
+        "space_members_space_id_fkey", "space_members", type_="foreignkey"
+    )
+    op.create_foreign_key(
+        "space_members_space_id_fkey",
+        "space_members",
+        "spaces",
+        ["space_id"],
+        ["id"],
+    )
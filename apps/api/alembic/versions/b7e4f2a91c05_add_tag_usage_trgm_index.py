@@ -0,0 +1,27 @@
+"""Add pg_trgm index on tag_usage.tag for autocomplete lookups"""
+
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "b7e4f2a91c05"
+down_revision: str | None = "a19f3d6c7b28"
+branch_labels: str | Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_tag_usage_tag_trgm",
+        "tag_usage",
+        ["tag"],
+        postgresql_using="gin",
+        postgresql_ops={"tag": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_tag_usage_tag_trgm", table_name="tag_usage")
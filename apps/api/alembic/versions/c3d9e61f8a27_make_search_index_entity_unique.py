@@ -0,0 +1,52 @@
+"""Make the search_index entity index unique to support upserts"""
+
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "c3d9e61f8a27"
+down_revision: str | None = "b7e4f2a91c05"
+branch_labels: str | Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The old SELECT-then-INSERT path could race in duplicate
+    # (entity_type, entity_id) rows; clear them out, keeping the newest,
+    # or the unique index below fails to build
+    op.execute(
+        sa.text(
+            """
+            DELETE FROM search_index a
+            USING search_index b
+            WHERE a.entity_type = b.entity_type
+              AND a.entity_id = b.entity_id
+              AND (
+                COALESCE(a.updated_at, a.created_at) < COALESCE(b.updated_at, b.created_at)
+                OR (
+                  COALESCE(a.updated_at, a.created_at) = COALESCE(b.updated_at, b.created_at)
+                  AND a.ctid < b.ctid
+                )
+              )
+            """
+        )
+    )
+
+    op.drop_index("idx_search_entity", table_name="search_index")
+    op.create_index(
+        "idx_search_entity",
+        "search_index",
+        ["entity_type", "entity_id"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_search_entity", table_name="search_index")
+    op.create_index(
+        "idx_search_entity",
+        "search_index",
+        ["entity_type", "entity_id"],
+    )
@@ -0,0 +1,25 @@
+"""Add composite index on articles (status, published_at DESC)"""
+
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d47c1af39e02"
+down_revision: str | None = "f010abb74553"
+branch_labels: str | Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Covers the feed queries filtering on status and ordering by recency
+    op.create_index(
+        "idx_articles_status_published_at",
+        "articles",
+        ["status", sa.text("published_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_articles_status_published_at", table_name="articles")
@@ -0,0 +1,79 @@
+"""Add stored tsvector columns and GIN indexes for full-text search"""
+
+from typing import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "e8b52c90d1f4"
+down_revision: str | None = "d47c1af39e02"
+branch_labels: str | Sequence[str] | None = None
+depends_on: Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # array_to_string is only STABLE, so generated columns need an
+    # IMMUTABLE wrapper to use it in their expression
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION immutable_array_to_string(text[], text)
+        RETURNS text LANGUAGE sql IMMUTABLE AS
+        $$ SELECT array_to_string($1, $2) $$
+        """
+    )
+
+    op.execute(
+        """
+        ALTER TABLE articles ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector(
+                'english',
+                title || ' ' || COALESCE(summary, '') || ' ' || immutable_array_to_string(tags, ' ')
+            )
+        ) STORED
+        """
+    )
+    op.create_index(
+        "idx_articles_search_vector", "articles", ["search_vector"], postgresql_using="gin"
+    )
+
+    op.execute(
+        """
+        ALTER TABLE spaces ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector(
+                'english',
+                name || ' ' || COALESCE(description, '') || ' ' || immutable_array_to_string(tags, ' ')
+            )
+        ) STORED
+        """
+    )
+    op.create_index(
+        "idx_spaces_search_vector", "spaces", ["search_vector"], postgresql_using="gin"
+    )
+
+    op.execute(
+        """
+        ALTER TABLE users ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            to_tsvector('english', COALESCE(display_name, '') || ' ' || email)
+        ) STORED
+        """
+    )
+    op.create_index(
+        "idx_users_search_vector", "users", ["search_vector"], postgresql_using="gin"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_users_search_vector", table_name="users")
+    op.drop_column("users", "search_vector")
+
+    op.drop_index("idx_spaces_search_vector", table_name="spaces")
+    op.drop_column("spaces", "search_vector")
+
+    op.drop_index("idx_articles_search_vector", table_name="articles")
+    op.drop_column("articles", "search_vector")
+
+    op.execute("DROP FUNCTION IF EXISTS immutable_array_to_string(text[], text)")
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from typing import Any, AsyncIterator
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -17,6 +18,10 @@ _engine: AsyncEngine | None = None
 _SessionLocal: async_sessionmaker[AsyncSession] | None = None
 
 
+def _json_serializer(value: Any) -> str:
+  return orjson.dumps(value).decode()
+
+
 def get_engine() -> AsyncEngine:
   global _engine
   if _engine is None:
@@ -24,6 +29,13 @@ def get_engine() -> AsyncEngine:
       settings.async_database_url,
       echo=False,
       pool_pre_ping=True,
+      # Sized above the app's distinct statement count so compiled SQL
+      # stays cached and asyncpg can keep reusing prepared statements
+      query_cache_size=1200,
+      # JSON columns (activity metadata) go through orjson instead of
+      # the stdlib encoder on every bind and fetch
+      json_serializer=_json_serializer,
+      json_deserializer=orjson.loads,
     )
   return _engine
 
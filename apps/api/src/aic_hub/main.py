@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
 from .config import settings
@@ -42,6 +43,7 @@ app = FastAPI(
   docs_url="/docs",
   redoc_url="/redoc",
   lifespan=lifespan,
+  default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(ProxyHeadersMiddleware)
@@ -5,12 +5,11 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import ARRAY, JSON
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..db import Base
-from ..types import GUID
+from ..types import GUID, StringList
 
 
 class Article(Base):
@@ -23,7 +22,7 @@ class Article(Base):
     slug: Mapped[str] = mapped_column(String(300), unique=True, nullable=False, index=True)
     summary: Mapped[str | None] = mapped_column(String(500), nullable=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)  # Will store JSON as text for now
-    tags: Mapped[list[str]] = mapped_column(ARRAY(String), default=list, nullable=False)
+    tags: Mapped[list[str]] = mapped_column(StringList(), default=list, nullable=False)
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="draft")  # draft, published
     author_id: Mapped[uuid.UUID] = mapped_column(
         GUID(), ForeignKey("users.id"), nullable=False
@@ -43,6 +42,11 @@ class Article(Base):
     # Relationships
     author = relationship("User", back_populates="articles")
 
+    __table_args__ = (
+        # Matches the hot feed query: published articles ordered by recency
+        Index("idx_articles_status_published_at", "status", text("published_at DESC")),
+    )
+
     @property
     def published(self) -> bool:
         """Check if article is published."""
@@ -6,11 +6,10 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import DateTime, Index, String, Text, func
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from ..db import Base
-from ..types import GUID
+from ..types import GUID, StringList
 
 
 class SearchIndex(Base):
@@ -20,10 +19,10 @@ class SearchIndex(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(GUID(), primary_key=True, default=uuid.uuid4)
     entity_type: Mapped[str] = mapped_column(String(20), nullable=False)  # article, space, user
-    entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    entity_id: Mapped[uuid.UUID] = mapped_column(GUID(), nullable=False)
     title: Mapped[str | None] = mapped_column(String(300), nullable=True)
     content: Mapped[str | None] = mapped_column(Text, nullable=True)
-    tags: Mapped[list[str]] = mapped_column(ARRAY(String), default=list, nullable=False)
+    tags: Mapped[list[str]] = mapped_column(StringList(), default=list, nullable=False)
     # Note: We'll add the search_vector column in the migration with proper PostgreSQL TSVector type
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
@@ -34,6 +33,6 @@ class SearchIndex(Base):
 
     # Indexes
     __table_args__ = (
-        Index('idx_search_entity', 'entity_type', 'entity_id'),
+        Index('idx_search_entity', 'entity_type', 'entity_id', unique=True),
         Index('idx_search_tags', 'tags', postgresql_using='gin'),
     )
\ No newline at end of file
@@ -15,11 +15,10 @@ from sqlalchemy import (
     Text,
     func,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..db import Base
-from ..types import GUID
+from ..types import GUID, StringList
 
 # Association table for space members
 from sqlalchemy import Column
@@ -27,8 +26,8 @@ from sqlalchemy import Column
 space_members = Table(
     "space_members",
     Base.metadata,
-    Column("space_id", UUID(as_uuid=True), ForeignKey("spaces.id"), primary_key=True),
-    Column("user_id", UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True),
+    Column("space_id", GUID(), ForeignKey("spaces.id", ondelete="CASCADE"), primary_key=True),
+    Column("user_id", GUID(), ForeignKey("users.id"), primary_key=True),
     Column("role", String(20), default="member", nullable=False),
     Column("joined_at", DateTime(timezone=True), server_default=func.now()),
     Index("idx_space_members_user", "user_id"),
@@ -43,11 +42,11 @@ class Space(Base):
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     slug: Mapped[str] = mapped_column(String(120), unique=True, nullable=False, index=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    tags: Mapped[list[str]] = mapped_column(ARRAY(String), default=list, nullable=False)
+    tags: Mapped[list[str]] = mapped_column(StringList(), default=list, nullable=False)
     visibility: Mapped[str] = mapped_column(String(20), default="public", nullable=False)
 
     owner_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
+        GUID(), ForeignKey("users.id"), nullable=False
     )
     member_count: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
     article_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -61,8 +60,15 @@ class Space(Base):
 
     # Relationships
     owner = relationship("User", foreign_keys=[owner_id])
-    members = relationship("User", secondary=space_members, back_populates="spaces")
-    space_articles = relationship("SpaceArticle", back_populates="space", cascade="all, delete-orphan")
+    members = relationship(
+        "User", secondary=space_members, back_populates="spaces", passive_deletes=True
+    )
+    space_articles = relationship(
+        "SpaceArticle",
+        back_populates="space",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
     __table_args__ = (
         Index("idx_spaces_visibility_created", "visibility", "created_at"),
@@ -75,13 +81,13 @@ class SpaceArticle(Base):
     __tablename__ = "space_articles"
 
     space_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("spaces.id"), primary_key=True
+        GUID(), ForeignKey("spaces.id", ondelete="CASCADE"), primary_key=True
     )
     article_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("articles.id"), primary_key=True
+        GUID(), ForeignKey("articles.id"), primary_key=True
     )
     added_by: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
+        GUID(), ForeignKey("users.id"), nullable=False
     )
     pinned: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     added_at: Mapped[datetime] = mapped_column(
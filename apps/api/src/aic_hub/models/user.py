@@ -4,11 +4,10 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import DateTime, String, Text, func, Index
-from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..db import Base
-from ..types import GUID
+from ..types import GUID, StringList
 
 
 class User(Base):
@@ -31,7 +30,7 @@ class User(Base):
   location: Mapped[str | None] = mapped_column(String(100), nullable=True)
 
   # AI expertise tags
-  expertise_tags: Mapped[list[str]] = mapped_column(ARRAY(String), default=[], nullable=False)
+  expertise_tags: Mapped[list[str]] = mapped_column(StringList(), default=[], nullable=False)
 
   oauth_accounts = relationship(
     "OAuthAccount",
@@ -6,11 +6,10 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import DateTime, ForeignKey, String, func
-from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..db import Base
-from ..types import GUID
+from ..types import GUID, StringList
 
 
 class UserPreferences(Base):
@@ -22,7 +21,7 @@ class UserPreferences(Base):
         GUID(), ForeignKey("users.id"), primary_key=True
     )
     preferred_tags: Mapped[list[str]] = mapped_column(
-        ARRAY(String), default=list, nullable=False
+        StringList(), default=list, nullable=False
     )
     feed_view: Mapped[str] = mapped_column(
         String(20), default="latest", nullable=False
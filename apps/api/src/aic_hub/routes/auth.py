@@ -11,6 +11,7 @@ from fastapi.responses import RedirectResponse
 from itsdangerous import BadSignature, BadTimeSignature, URLSafeTimedSerializer
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, SecretStr
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
@@ -121,26 +122,20 @@ def _to_public_user(user: User) -> PublicUser:
 
 async def _generate_unique_username(session: AsyncSession, preferred_username: str) -> str:
   """Generate a unique username by appending numbers if needed."""
-  base_username = preferred_username
-  counter = 1
+  # Fetch every username sharing the prefix in one query and probe the
+  # candidates in memory instead of one SELECT per collision
+  result = await session.scalars(
+    select(User.username).where(User.username.like(f"{preferred_username}%"))
+  )
+  taken = set(result)
 
-  while True:
-    # Check if username is available
-    existing = await session.scalar(select(User).where(User.username == preferred_username))
-    if not existing:
-      return preferred_username
+  if preferred_username not in taken:
+    return preferred_username
 
-    # Try with a number suffix
-    preferred_username = f"{base_username}{counter}"
+  counter = 1
+  while f"{preferred_username}{counter}" in taken:
     counter += 1
-
-    # Safety limit to prevent infinite loops
-    if counter > 1000:
-      import secrets
-      preferred_username = f"{base_username}_{secrets.token_hex(4)}"
-      break
-
-  return preferred_username
+  return f"{preferred_username}{counter}"
 
 
 def _populate_github_profile_data(user: User, profile) -> None:
@@ -502,7 +497,16 @@ async def github_callback(
         expertise_tags=[]
       )
       session.add(user)
-      await session.flush()
+      try:
+        await session.flush()
+      except IntegrityError:
+        # Lost the username race to a concurrent signup between the
+        # range probe and the insert; the unique index is the arbiter,
+        # so re-probe and retry once
+        await session.rollback()
+        user.username = await _generate_unique_username(session, profile.login)
+        session.add(user)
+        await session.flush()
       oauth_account = OAuthAccount(
         user_id=user.id,
         provider=OAuthProvider.GITHUB,
@@ -512,10 +516,13 @@ async def github_callback(
       action = "oauth_created"
 
   # Update existing user with latest GitHub data
+  had_username = user.username is not None
   _populate_github_profile_data(user, profile)
 
-  # Ensure username is unique if it was updated
-  if user.username and user.username == profile.login:
+  # Ensure uniqueness only when the username was just derived from the
+  # login; established users keep theirs, with no probe query and no
+  # risk of the generator treating their own row as a collision
+  if not had_username and user.username == profile.login:
     user.username = await _generate_unique_username(session, profile.login)
 
   user.last_login = datetime.now(tz=UTC)
@@ -6,6 +6,7 @@ import time
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -105,24 +106,17 @@ async def search(
     # Calculate processing time
     processing_time = int((time.time() - start_time) * 1000)
 
-    return SearchResponse(
-        results=[
-            SearchResultItem(
-                type=result["type"],
-                score=result["score"],
-                item=result["item"],
-            )
-            for result in search_results["results"]
-        ],
-        total=search_results["total"],
-        facets=SearchFacets(
-            types=search_results["facets"]["types"],
-            tags=search_results["facets"]["tags"],
-        ),
-        skip=skip,
-        limit=limit,
-        processingTime=processing_time,
-    )
+    # The service payload already matches SearchResponse (which still
+    # documents the schema); serializing it directly with orjson skips a
+    # per-row pydantic model pass on the hot path
+    return ORJSONResponse({
+        "results": search_results["results"],
+        "total": search_results["total"],
+        "facets": search_results["facets"],
+        "skip": skip,
+        "limit": limit,
+        "processingTime": processing_time,
+    })
 
 
 @router.get("/autocomplete", response_model=AutocompleteResponse)
@@ -144,17 +138,7 @@ async def autocomplete(
     """
     suggestions = await SearchService.autocomplete(db, q, limit)
 
-    return AutocompleteResponse(
-        suggestions=[
-            AutocompleteSuggestion(
-                type=s["type"],
-                text=s["text"],
-                count=s.get("count"),
-                slug=s.get("slug"),
-            )
-            for s in suggestions
-        ]
-    )
+    return ORJSONResponse({"suggestions": suggestions})
 
 
 @router.post("/index", status_code=status.HTTP_202_ACCEPTED)
@@ -174,6 +158,7 @@ async def update_search_index(
         202 Accepted status
     """
     # TODO: Implement admin authentication check
-    # TODO: Trigger background job to rebuild search index
+
+    await SearchService.refresh_search_documents()
 
     return {"message": "Search index update triggered"}
\ No newline at end of file
@@ -2,16 +2,67 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import and_, desc, or_, select
+from sqlalchemy import and_, desc, insert, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from ..db import get_session_factory
 from ..models import Activity, Article, Space, User
 
+logger = logging.getLogger(__name__)
+
+# Activities are fire-and-forget; queueing them lets a background task
+# amortize many records into one bulk insert and one commit
+_activity_queue: asyncio.Queue[Dict[str, Any]] | None = None
+_drain_task: asyncio.Task | None = None
+
+_FLUSH_BATCH = 100
+_FLUSH_INTERVAL = 0.25
+
+
+def _get_activity_queue() -> asyncio.Queue[Dict[str, Any]]:
+    global _activity_queue, _drain_task
+    if _activity_queue is None:
+        _activity_queue = asyncio.Queue(maxsize=1024)
+    if _drain_task is None or _drain_task.done():
+        _drain_task = asyncio.get_running_loop().create_task(
+            _drain_activities(_activity_queue)
+        )
+    return _activity_queue
+
+
+async def _drain_activities(queue: asyncio.Queue[Dict[str, Any]]) -> None:
+    """Flush queued activities in bulk every _FLUSH_INTERVAL seconds."""
+    loop = asyncio.get_running_loop()
+    session_factory = get_session_factory()
+    while True:
+        rows = [await queue.get()]
+        deadline = loop.time() + _FLUSH_INTERVAL
+        while len(rows) < _FLUSH_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                rows.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        try:
+            async with session_factory() as session:
+                await session.execute(insert(Activity), rows)
+                await session.commit()
+        except Exception:
+            # Activity records are best-effort; keep the drain task
+            # alive, but a persistent failure here means records are
+            # being lost and must not disappear silently
+            logger.exception("activity flush failed; dropped %d records", len(rows))
+
 
 class ActivityService:
     """Service for managing user activities and activity streams."""
@@ -32,6 +83,54 @@ class ActivityService:
     TARGET_SPACE = "space"
     TARGET_USER = "user"
 
+    @staticmethod
+    def enqueue(
+        actor_id: UUID,
+        action: str,
+        target_type: str,
+        target_id: UUID,
+        metadata: dict | None = None,
+    ) -> bool:
+        """Queue an activity for the background bulk writer.
+
+        Returns False when the queue is full; the caller should fall back
+        to the synchronous record_activity so backpressure is applied
+        instead of dropping records.
+        """
+        queue = _get_activity_queue()
+        try:
+            queue.put_nowait({
+                "id": uuid4(),
+                "actor_id": actor_id,
+                "action": action,
+                "target_type": target_type,
+                "target_id": target_id,
+                "activity_metadata": metadata or {},
+            })
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    @staticmethod
+    async def record_activity_buffered(
+        db: AsyncSession,
+        actor_id: UUID,
+        action: str,
+        target_type: str,
+        target_id: UUID,
+        metadata: dict | None = None,
+    ) -> None:
+        """Record an activity via the background queue when possible.
+
+        Falls back to the synchronous record_activity when the queue is
+        full, applying backpressure rather than dropping the record.
+        """
+        if ActivityService.enqueue(actor_id, action, target_type, target_id, metadata):
+            return
+        await ActivityService.record_activity(
+            db, actor_id, action, target_type, target_id, metadata
+        )
+
     @staticmethod
     async def record_activity(
         db: AsyncSession,
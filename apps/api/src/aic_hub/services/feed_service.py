@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import and_, desc, func, lambda_stmt, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, selectinload
 
+from ..db import get_session_factory
 from ..models import Activity, Article, Space, User, UserPreferences
 
+# numpy is optional; batch scoring falls back to the scalar path without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class FeedService:
     """Service for managing feeds, trending content, and recommendations."""
@@ -45,29 +54,28 @@ class FeedService:
         total = 0
 
         if view == "latest":
-            # Get latest published articles
-            query = select(Article).where(Article.status == "published")
+            # Get latest published articles. lambda_stmt caches the compiled
+            # SQL per code path so repeated calls only swap bound parameters.
+            query = lambda_stmt(lambda: select(Article).where(Article.status == "published"))
 
             # Apply tag filters
             if tags:
-                query = query.where(Article.tags.overlap(tags))
-
-            # Add author relationship
-            query = query.options(selectinload(Article.author))
-
-            # Order by published date
-            query = query.order_by(desc(Article.published_at))
+                query += lambda s: s.where(Article.tags.overlap(tags))
 
-            # Apply pagination
-            query = query.offset(skip).limit(limit)
+            # Add author relationship, order by published date, paginate
+            query += lambda s: s.options(selectinload(Article.author))
+            query += lambda s: s.order_by(desc(Article.published_at))
+            query += lambda s: s.offset(skip).limit(limit)
 
             result = await db.execute(query)
             articles = result.scalars().all()
 
             # Count total
-            count_query = select(func.count()).select_from(Article).where(Article.status == "published")
+            count_query = lambda_stmt(
+                lambda: select(func.count()).select_from(Article).where(Article.status == "published")
+            )
             if tags:
-                count_query = count_query.where(Article.tags.overlap(tags))
+                count_query += lambda s: s.where(Article.tags.overlap(tags))
             total_result = await db.execute(count_query)
             total = total_result.scalar() or 0
 
@@ -93,7 +101,10 @@ class FeedService:
 
         elif view == "trending":
             # Calculate trending content
-            items = await FeedService._get_trending_items(db, tags, time_range, skip, limit)
+            items = [
+                item async for item in
+                FeedService._get_trending_items(db, tags, time_range, skip, limit)
+            ]
             total = len(items)  # Simplified for now
 
         elif view == "following":
@@ -103,7 +114,10 @@ class FeedService:
         elif view == "recommended":
             # Get recommendations based on user preferences
             if user_id:
-                items = await FeedService._get_recommendations(db, user_id, tags, skip, limit)
+                items = [
+                    item async for item in
+                    FeedService._get_recommendations(db, user_id, tags, skip, limit)
+                ]
                 total = len(items)
 
         return {
@@ -146,29 +160,26 @@ class FeedService:
         else:
             time_boundary = None
 
-        if content_type in ["articles", "all"]:
-            # Get trending articles
-            query = select(Article).where(Article.status == "published")
-
-            if time_boundary:
-                query = query.where(Article.published_at >= time_boundary)
+        articles: List[Article] = []
+        spaces: List[Space] = []
 
-            query = query.options(selectinload(Article.author))
-            query = query.order_by(desc(Article.view_count))
-            query = query.limit(limit)
-
-            result = await db.execute(query)
-            articles = result.scalars().all()
+        if content_type == "all":
+            # Overlap the two round-trips; the spaces query runs on its own
+            # session so both SELECTs are in flight concurrently
+            articles, spaces = await asyncio.gather(
+                FeedService._fetch_trending_articles(db, time_boundary, limit),
+                FeedService._fetch_trending_spaces(None, time_boundary, limit),
+            )
+        elif content_type == "articles":
+            articles = await FeedService._fetch_trending_articles(db, time_boundary, limit)
+        elif content_type == "spaces":
+            spaces = await FeedService._fetch_trending_spaces(db, time_boundary, limit)
 
-            for article in articles:
-                # Calculate trending score
-                age_hours = (now - article.published_at).total_seconds() / 3600 if article.published_at else 1
-                score = FeedService.calculate_trending_score(
-                    article.view_count,
-                    age_hours,
-                    article.like_count
-                )
+        if articles:
+            # Score the whole batch at once instead of one pow() per article
+            scores = FeedService._batch_trending_scores(articles, now)
 
+            for article, score in zip(articles, scores):
                 trending_items.append({
                     "type": "article",
                     "data": {
@@ -188,19 +199,7 @@ class FeedService:
                     "trend": "rising"  # TODO: Calculate actual trend
                 })
 
-        if content_type in ["spaces", "all"]:
-            # Get trending spaces
-            query = select(Space).where(Space.visibility == "public")
-
-            if time_boundary:
-                query = query.where(Space.created_at >= time_boundary)
-
-            query = query.order_by(desc(Space.member_count))
-            query = query.limit(limit)
-
-            result = await db.execute(query)
-            spaces = result.scalars().all()
-
+        if spaces:
             for space in spaces:
                 trending_items.append({
                     "type": "space",
@@ -217,13 +216,66 @@ class FeedService:
                     "activityScore": space.member_count * 10 + space.article_count * 5
                 })
 
-        # Sort by score/activity
+        # Sort by score/activity; only the mixed feed needs the key-fallback
+        # lambda, single-type requests sort on their native key directly
         if content_type == "all":
             trending_items.sort(key=lambda x: x.get("score", x.get("activityScore", 0)), reverse=True)
             trending_items = trending_items[:limit]
+        elif content_type == "articles":
+            trending_items.sort(key=itemgetter("score"), reverse=True)
+        elif content_type == "spaces":
+            trending_items.sort(key=itemgetter("activityScore"), reverse=True)
 
         return trending_items
 
+    @staticmethod
+    async def _fetch_trending_articles(
+        db: AsyncSession,
+        time_boundary: datetime | None,
+        limit: int
+    ) -> List[Article]:
+        """Fetch trending article candidates with authors eagerly joined."""
+        query = lambda_stmt(lambda: select(Article).where(Article.status == "published"))
+
+        if time_boundary:
+            query += lambda s: s.where(Article.published_at >= time_boundary)
+
+        # Hydrate authors from the same SELECT; the identity map dedupes
+        # authors shared across trending articles
+        query += lambda s: s.join(Article.author).options(contains_eager(Article.author))
+        query += lambda s: s.order_by(desc(Article.view_count))
+        query += lambda s: s.limit(limit)
+
+        result = await db.execute(query)
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def _fetch_trending_spaces(
+        db: AsyncSession | None,
+        time_boundary: datetime | None,
+        limit: int
+    ) -> List[Space]:
+        """Fetch trending space candidates, on a dedicated session if db is None."""
+        if db is None:
+            session_factory = get_session_factory()
+            async with session_factory() as session:
+                return await FeedService._fetch_trending_spaces(session, time_boundary, limit)
+
+        query = lambda_stmt(lambda: select(Space).where(Space.visibility == "public"))
+
+        if time_boundary:
+            query += lambda s: s.where(Space.created_at >= time_boundary)
+
+        # Rank by the activity score in SQL so the database returns the
+        # top spaces directly instead of the most-joined ones
+        query += lambda s: s.order_by(
+            desc(Space.member_count * 10 + Space.article_count * 5)
+        )
+        query += lambda s: s.limit(limit)
+
+        result = await db.execute(query)
+        return list(result.scalars().all())
+
     @staticmethod
     async def get_discovery_content(
         db: AsyncSession,
@@ -245,9 +297,12 @@ class FeedService:
         """
         items = []
 
+        # Single timestamp for the whole request; reused for boundaries,
+        # velocity calculations, and the refresh hint
+        now = datetime.now(timezone.utc)
+
         if category == "rising_articles":
             # Get articles with high view velocity
-            now = datetime.now(timezone.utc)
             recent_boundary = now - timedelta(hours=6)
 
             query = select(Article).where(
@@ -310,7 +365,7 @@ class FeedService:
 
         elif category == "new_users":
             # Get recently joined users
-            recent_boundary = datetime.now(timezone.utc) - timedelta(days=7)
+            recent_boundary = now - timedelta(days=7)
 
             query = select(User).where(User.created_at >= recent_boundary)
             query = query.order_by(desc(User.created_at))
@@ -332,7 +387,7 @@ class FeedService:
         return {
             "category": category,
             "items": items,
-            "refreshAt": (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+            "refreshAt": (now + timedelta(hours=1)).isoformat()
         }
 
     @staticmethod
@@ -352,25 +407,51 @@ class FeedService:
         Returns:
             List of recommended articles
         """
-        # Get user preferences
-        preferences = await db.get(UserPreferences, user_id)
+        # Load preferences and an optimistic top-articles batch concurrently.
+        # The article fetch runs on its own session so both round-trips overlap.
+        preferences, prefetched = await asyncio.gather(
+            db.get(UserPreferences, user_id),
+            FeedService._fetch_top_articles(limit * 2),
+        )
 
-        # Base query for articles
-        query = select(Article).where(Article.status == "published")
+        # Exclude articles the user has already seen (simplified for now)
+        # TODO: Track user views and exclude them
 
-        # If user has preferred tags, prioritize them
         if preferences and preferences.preferred_tags:
+            # Filter the prefetched batch in Python by tag overlap
+            preferred = set(preferences.preferred_tags)
+            matching = [
+                article for article in prefetched
+                if preferred & set(article.tags or [])
+            ]
+            if len(matching) >= limit:
+                return matching[:limit]
+
+            # Not enough overlap in the prefetched window; re-issue the
+            # tag-filtered query for the full result
+            query = select(Article).where(Article.status == "published")
             query = query.where(Article.tags.overlap(preferences.preferred_tags))
+            query = query.options(selectinload(Article.author))
+            query = query.order_by(desc(Article.view_count))
+            query = query.limit(limit)
 
-        # Exclude articles the user has already seen (simplified for now)
-        # TODO: Track user views and exclude them
+            result = await db.execute(query)
+            return result.scalars().all()
 
-        query = query.options(selectinload(Article.author))
-        query = query.order_by(desc(Article.view_count))
-        query = query.limit(limit)
+        return prefetched[:limit]
 
-        result = await db.execute(query)
-        return result.scalars().all()
+    @staticmethod
+    async def _fetch_top_articles(limit: int) -> List[Article]:
+        """Fetch top published articles by view count on a dedicated session."""
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            query = select(Article).where(Article.status == "published")
+            query = query.options(selectinload(Article.author))
+            query = query.order_by(desc(Article.view_count))
+            query = query.limit(limit)
+
+            result = await session.execute(query)
+            return list(result.scalars().all())
 
     @staticmethod
     def calculate_trending_score(
@@ -395,6 +476,46 @@ class FeedService:
         time_penalty = pow(age_hours + 2, 1.5)
         return base_score / time_penalty
 
+    @staticmethod
+    def _batch_trending_scores(
+        articles: List[Article],
+        now: datetime
+    ) -> List[float]:
+        """
+        Calculate trending scores for a batch of articles.
+
+        Uses numpy to evaluate the scoring formula as a single vectorized
+        expression when available, avoiding per-article Python pow() calls.
+
+        Args:
+            articles: Articles to score
+            now: Reference timestamp for age calculation
+
+        Returns:
+            Scores in the same order as the input articles
+        """
+        def age_hours(article: Article) -> float:
+            if article.published_at:
+                return (now - article.published_at).total_seconds() / 3600
+            return 1.0
+
+        if np is not None and len(articles) > 1:
+            count = len(articles)
+            views = np.fromiter((a.view_count for a in articles), dtype=np.int64, count=count)
+            likes = np.fromiter((a.like_count for a in articles), dtype=np.int64, count=count)
+            ages = np.fromiter((age_hours(a) for a in articles), dtype=np.float64, count=count)
+            scores = (views + 2 * likes) / np.power(ages + 2, 1.5)
+            return scores.tolist()
+
+        return [
+            FeedService.calculate_trending_score(
+                article.view_count,
+                age_hours(article),
+                article.like_count
+            )
+            for article in articles
+        ]
+
     @staticmethod
     async def _get_trending_items(
         db: AsyncSession,
@@ -402,33 +523,29 @@ class FeedService:
         time_range: str | None,
         skip: int,
         limit: int
-    ) -> List[Dict[str, Any]]:
-        """Get trending items for feed."""
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield formatted trending items for the feed."""
         trending = await FeedService.calculate_trending(
             db, time_range or "24h", "articles", limit
         )
 
-        # Filter by tags if provided
+        # Filter by tags if provided; hashed intersection instead of a
+        # nested linear scan per item
         if tags:
+            tag_set = frozenset(tags)
             trending = [
                 item for item in trending
-                if any(tag in item["data"].get("tags", []) for tag in tags)
+                if not tag_set.isdisjoint(item["data"].get("tags", []))
             ]
 
-        # Apply pagination
-        trending = trending[skip:skip + limit]
-
-        # Format for feed
-        items = []
-        for item in trending:
-            items.append({
+        # Format the requested page lazily; the caller drives consumption
+        for item in trending[skip:skip + limit]:
+            yield {
                 "type": "article",
                 "article": item["data"],
                 "reason": "trending_in_period",
                 "score": item["score"]
-            })
-
-        return items
+            }
 
     @staticmethod
     async def _get_recommendations(
@@ -437,13 +554,12 @@ class FeedService:
         tags: List[str] | None,
         skip: int,
         limit: int
-    ) -> List[Dict[str, Any]]:
-        """Get recommended items for feed."""
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield formatted recommended items for the feed."""
         articles = await FeedService.get_recommendations(db, user_id, limit)
 
-        items = []
         for article in articles:
-            items.append({
+            yield {
                 "type": "article",
                 "article": {
                     "id": str(article.id),
@@ -459,6 +575,4 @@ class FeedService:
                     }
                 },
                 "reason": "recommended"
-            })
-
-        return items
\ No newline at end of file
+            }
\ No newline at end of file
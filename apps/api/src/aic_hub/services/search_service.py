@@ -2,16 +2,179 @@
 
 from __future__ import annotations
 
-import math
-from datetime import datetime, timezone
-from typing import Any, Dict, List
-from uuid import UUID
-
-from sqlalchemy import and_, func, or_, select, text
+import asyncio
+import heapq
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..constants import AI_TAGS
-from ..models import Article, SearchIndex, Space, User
+from ..db import get_engine, get_session_factory
+from ..models import SearchIndex
+from ..utils import TTLCache
+
+# Popular queries repeat; short TTLs keep results fresh while absorbing
+# the repeats in memory (adapted from the usual Redis-fronted setup —
+# the deployment has no external cache tier, so this is per-process)
+_search_cache = TTLCache(maxsize=1024, ttl=60.0)
+_autocomplete_cache = TTLCache(maxsize=2048, ttl=300.0)
+
+
+def _article_search_sql(tagged: bool):
+    """Build the article search statement, with or without the tag filter."""
+    tag_filter = "AND a.tags && :tags" if tagged else ""
+    tag_bonus = "* 1.5" if tagged else ""
+    return text(f"""
+        SELECT
+            a.id,
+            a.title,
+            a.slug,
+            a.summary,
+            a.tags,
+            a.author_id,
+            a.view_count,
+            a.like_count,
+            a.created_at,
+            a.published_at,
+            u.display_name as author_name,
+            u.email as author_email,
+            ts_headline(
+                'english', a.title, websearch_to_tsquery('english', :query),
+                'StartSel=<mark>, StopSel=</mark>, HighlightAll=true'
+            ) as title_highlight,
+            ts_headline(
+                'english', COALESCE(a.summary, ''), websearch_to_tsquery('english', :query),
+                'MaxWords=30, MinWords=15, StartSel=<mark>, StopSel=</mark>'
+            ) as content_highlight,
+            (
+                ts_rank_cd(a.search_vector, websearch_to_tsquery('english', :query), 32) * 100
+                + ln(a.view_count + 1) * 10
+                + COALESCE(1.0 / (1.0 + EXTRACT(EPOCH FROM (NOW() - a.published_at)) / 2592000.0), 0) * 20
+            ) {tag_bonus} as score,
+            count(*) OVER () as total_rows
+        FROM articles a
+        JOIN users u ON a.author_id = u.id
+        WHERE a.status = 'published'
+        AND a.search_vector @@ websearch_to_tsquery('english', :query)
+        {tag_filter}
+        ORDER BY score DESC
+        LIMIT :limit
+    """)
+
+
+def _space_search_sql(tagged: bool):
+    """Build the space search statement, with or without the tag filter."""
+    tag_filter = "AND s.tags && :tags" if tagged else ""
+    tag_bonus = "* 1.5" if tagged else ""
+    return text(f"""
+        SELECT
+            s.id,
+            s.name,
+            s.slug,
+            s.description,
+            s.tags,
+            s.member_count,
+            s.article_count,
+            s.visibility,
+            s.created_at,
+            s.owner_id,
+            u.display_name as owner_name,
+            u.email as owner_email,
+            ts_headline(
+                'english', s.name, websearch_to_tsquery('english', :query),
+                'StartSel=<mark>, StopSel=</mark>, HighlightAll=true'
+            ) as title_highlight,
+            ts_headline(
+                'english', COALESCE(s.description, ''), websearch_to_tsquery('english', :query),
+                'MaxWords=30, MinWords=15, StartSel=<mark>, StopSel=</mark>'
+            ) as content_highlight,
+            (
+                ts_rank_cd(s.search_vector, websearch_to_tsquery('english', :query), 32) * 100 * 0.9
+                + ln(s.member_count + 1) * 10
+                + ln(s.article_count + 1) * 5
+            ) {tag_bonus} as score,
+            count(*) OVER () as total_rows
+        FROM spaces s
+        JOIN users u ON s.owner_id = u.id
+        WHERE s.visibility = 'public'
+        AND s.search_vector @@ websearch_to_tsquery('english', :query)
+        {tag_filter}
+        ORDER BY score DESC
+        LIMIT :limit
+    """)
+
+
+# Statements are constructed (and their SQL cached) once at import; per-call
+# work is reduced to binding parameters
+_ARTICLE_SEARCH_SQL = _article_search_sql(tagged=False)
+_ARTICLE_SEARCH_SQL_TAGGED = _article_search_sql(tagged=True)
+_SPACE_SEARCH_SQL = _space_search_sql(tagged=False)
+_SPACE_SEARCH_SQL_TAGGED = _space_search_sql(tagged=True)
+
+_USER_SEARCH_SQL = text("""
+    SELECT
+        u.id,
+        u.email,
+        u.display_name,
+        u.created_at,
+        ts_rank_cd(u.search_vector, websearch_to_tsquery('english', :query), 32) * 100 * 0.8 as score,
+        count(*) OVER () as total_rows
+    FROM users u
+    WHERE u.search_vector @@ websearch_to_tsquery('english', :query)
+    ORDER BY score DESC
+    LIMIT :limit
+""")
+
+_TAG_FACET_SQL = text("""
+    SELECT tag, count(*) AS count
+    FROM search_documents d, unnest(d.tags) AS tag
+    WHERE d.search_vector @@ websearch_to_tsquery('english', :query)
+    AND (CAST(:entity_type AS text) IS NULL OR d.entity_type = :entity_type)
+    GROUP BY tag
+    ORDER BY count DESC
+""")
+
+# One round-trip for all suggestion kinds; the tag branch is served by
+# the pg_trgm GIN index on tag_usage.tag
+_AUTOCOMPLETE_SQL = text("""
+    (
+        SELECT
+            'tag' AS kind,
+            tag AS text,
+            CAST(NULL AS text) AS slug,
+            article_count + space_count + user_count AS count
+        FROM tag_usage
+        WHERE tag ILIKE :pattern
+        ORDER BY count DESC
+        LIMIT 3
+    )
+    UNION ALL
+    (
+        SELECT 'article', title, slug, view_count
+        FROM articles
+        WHERE status = 'published'
+        AND title ILIKE :pattern
+        ORDER BY view_count DESC
+        LIMIT :limit
+    )
+    UNION ALL
+    (
+        SELECT 'space', name, slug, member_count
+        FROM spaces
+        WHERE visibility = 'public'
+        AND name ILIKE :pattern
+        ORDER BY member_count DESC
+        LIMIT :limit
+    )
+""")
+
+
+async def _no_results() -> Tuple[List[Dict[str, Any]], int]:
+    """Stand-in awaitable for a per-type search that was skipped."""
+    return [], 0
 
 
 class SearchService:
@@ -40,121 +203,157 @@ class SearchService:
         Returns:
             Search results with facets and metadata
         """
+        cache_key = (query, search_type, tuple(tags) if tags else None, skip, limit)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         results = []
+        total = 0
         facets = {"types": {}, "tags": {}}
 
-        # Search articles
-        if search_type in ["all", "articles"]:
-            article_results = await SearchService._search_articles(
-                db, query, tags
+        # Each per-type search only needs enough rows to fill the requested
+        # page after the cross-type merge
+        cap = skip + limit
+
+        if search_type == "all":
+            # Users only index a name and an email, so a long phrase query
+            # cannot match one; skip that round-trip entirely
+            user_search = (
+                SearchService._search_on_own_session(SearchService._search_users, query, tags, cap)
+                if len(query.split()) <= 3
+                else _no_results()
             )
-            results.extend(article_results)
-            facets["types"]["articles"] = len(article_results)
 
-        # Search spaces
-        if search_type in ["all", "spaces"]:
-            space_results = await SearchService._search_spaces(
-                db, query, tags
+            # Run the per-type searches and the facet aggregation
+            # concurrently; everything past the first gets its own session
+            # since one connection can only execute a single statement at a
+            # time
+            articles, spaces, users, tag_facets = await asyncio.gather(
+                SearchService._search_articles(db, query, tags, cap),
+                SearchService._search_on_own_session(SearchService._search_spaces, query, tags, cap),
+                user_search,
+                SearchService._tag_facets(None, query),
+            )
+            # Each query carries its full hit count alongside the capped
+            # page, so total and the type facets stay truthful
+            for (type_results, type_total), type_name in (
+                (articles, "articles"), (spaces, "spaces"), (users, "users")
+            ):
+                results.extend(type_results)
+                total += type_total
+                facets["types"][type_name] = type_total
+        elif search_type == "articles":
+            (article_results, total), tag_facets = await asyncio.gather(
+                SearchService._search_articles(db, query, tags, cap),
+                SearchService._tag_facets(None, query, "article"),
+            )
+            results.extend(article_results)
+            facets["types"]["articles"] = total
+        elif search_type == "spaces":
+            (space_results, total), tag_facets = await asyncio.gather(
+                SearchService._search_spaces(db, query, tags, cap),
+                SearchService._tag_facets(None, query, "space"),
             )
             results.extend(space_results)
-            facets["types"]["spaces"] = len(space_results)
-
-        # Search users
-        if search_type in ["all", "users"]:
-            user_results = await SearchService._search_users(
-                db, query, tags
+            facets["types"]["spaces"] = total
+        elif search_type == "users":
+            (user_results, total), tag_facets = await asyncio.gather(
+                SearchService._search_users(db, query, tags, cap),
+                SearchService._tag_facets(None, query, "user"),
             )
             results.extend(user_results)
-            facets["types"]["users"] = len(user_results)
-
-        # Sort results by score
-        results.sort(key=lambda x: x["score"], reverse=True)
+            facets["types"]["users"] = total
+        else:
+            tag_facets = {}
 
-        # Calculate tag facets from results
-        tag_counts = {}
-        for result in results:
-            if "tags" in result["item"]:
-                for tag in result["item"]["tags"]:
-                    tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        facets["tags"] = tag_counts
+        facets["tags"] = tag_facets
 
-        # Apply pagination
-        paginated_results = results[skip:skip + limit]
+        # Only the top skip+limit merged hits are returned, so a bounded
+        # heap selection beats sorting every hit
+        paginated_results = heapq.nlargest(cap, results, key=itemgetter("score"))[skip:]
 
-        return {
+        response = {
             "results": paginated_results,
-            "total": len(results),
+            "total": total,
             "facets": facets,
             "skip": skip,
             "limit": limit,
             "processingTime": 0  # Will be calculated by endpoint
         }
+        _search_cache.set(cache_key, response)
+        return response
+
+    @staticmethod
+    async def _search_on_own_session(
+        search_fn: Callable[
+            [AsyncSession, str, List[str] | None, int],
+            Awaitable[Tuple[List[Dict[str, Any]], int]],
+        ],
+        query: str,
+        tags: List[str] | None,
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Run a per-type search on a dedicated session for concurrent use."""
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            return await search_fn(session, query, tags, limit)
+
+    @staticmethod
+    async def _tag_facets(
+        db: AsyncSession | None,
+        query: str,
+        entity_type: str | None = None
+    ) -> Dict[str, int]:
+        """Aggregate tag facets for a query in SQL via unnest(tags).
+
+        Counts tags across every matching row in search_documents rather
+        than looping over fetched results in Python. With db=None a
+        dedicated session is used so the facet query can run concurrently
+        with the searches.
+        """
+        params = {"query": query, "entity_type": entity_type}
+        if db is not None:
+            result = await db.execute(_TAG_FACET_SQL, params)
+        else:
+            session_factory = get_session_factory()
+            async with session_factory() as session:
+                result = await session.execute(_TAG_FACET_SQL, params)
+        return {row.tag: row.count for row in result}
 
     @staticmethod
     async def _search_articles(
         db: AsyncSession,
         query: str,
-        tags: List[str] | None = None
-    ) -> List[Dict[str, Any]]:
+        tags: List[str] | None = None,
+        limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """Search articles using PostgreSQL full-text search."""
-        # Build base query with text search
-        search_query = text("""
-            SELECT
-                a.id,
-                a.title,
-                a.slug,
-                a.summary,
-                a.tags,
-                a.author_id,
-                a.view_count,
-                a.like_count,
-                a.created_at,
-                a.published_at,
-                u.display_name as author_name,
-                u.email as author_email,
-                ts_rank(
-                    to_tsvector('english', a.title || ' ' || COALESCE(a.summary, '') || ' ' || array_to_string(a.tags, ' ')),
-                    plainto_tsquery('english', :query)
-                ) as rank
-            FROM articles a
-            JOIN users u ON a.author_id = u.id
-            WHERE a.status = 'published'
-            AND to_tsvector('english', a.title || ' ' || COALESCE(a.summary, '') || ' ' || array_to_string(a.tags, ' '))
-                @@ plainto_tsquery('english', :query)
-        """)
-
-        # Execute search
-        result = await db.execute(search_query, {"query": query})
-        rows = result.fetchall()
+        # Tag filtering, the row cap, and the combined score all run in SQL;
+        # only rows that survive reach Python. The tagged variant applies the
+        # 1.5x match bonus, guaranteed by its SQL filter.
+        search_query = _ARTICLE_SEARCH_SQL_TAGGED if tags else _ARTICLE_SEARCH_SQL
+
+        params: Dict[str, Any] = {"query": query, "limit": limit}
+        if tags:
+            params["tags"] = tags
+
+        # Stream with a server-side cursor so memory stays bounded by the
+        # page, not the hit count
+        result = await db.stream(search_query, params)
 
         articles = []
-        for row in rows:
-            # Apply tag filter if specified
-            if tags and not any(tag in row.tags for tag in tags):
-                continue
-
-            # Calculate combined score
-            text_rank = row.rank
-            popularity = math.log(row.view_count + 1)
-            recency = 0
-            if row.published_at:
-                days_old = (datetime.now(timezone.utc) - row.published_at).days
-                recency = 1 / (1 + days_old / 30)
-
-            score = (text_rank * 100) + (popularity * 10) + (recency * 20)
-
-            # Check for exact tag match bonus
-            if tags and any(tag in row.tags for tag in tags):
-                score *= 1.5
-
-            # Create highlighted snippets
-            highlights = SearchService._create_highlights(
-                row.title, row.summary or "", query
-            )
+        total = 0
+        async for row in result:
+            total = row.total_rows
+            # Highlights come pre-marked from ts_headline in the query
+            highlights = {"title": row.title_highlight}
+            if row.content_highlight:
+                highlights["content"] = row.content_highlight
 
             articles.append({
                 "type": "article",
-                "score": score,
+                "score": row.score,
                 "item": {
                     "id": str(row.id),
                     "title": row.title,
@@ -173,67 +372,35 @@ class SearchService:
                 }
             })
 
-        return articles
+        return articles, total
 
     @staticmethod
     async def _search_spaces(
         db: AsyncSession,
         query: str,
-        tags: List[str] | None = None
-    ) -> List[Dict[str, Any]]:
+        tags: List[str] | None = None,
+        limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """Search spaces using PostgreSQL full-text search."""
-        search_query = text("""
-            SELECT
-                s.id,
-                s.name,
-                s.slug,
-                s.description,
-                s.tags,
-                s.member_count,
-                s.article_count,
-                s.visibility,
-                s.created_at,
-                s.owner_id,
-                u.display_name as owner_name,
-                u.email as owner_email,
-                ts_rank(
-                    to_tsvector('english', s.name || ' ' || COALESCE(s.description, '') || ' ' || array_to_string(s.tags, ' ')),
-                    plainto_tsquery('english', :query)
-                ) as rank
-            FROM spaces s
-            JOIN users u ON s.owner_id = u.id
-            WHERE s.visibility = 'public'
-            AND to_tsvector('english', s.name || ' ' || COALESCE(s.description, '') || ' ' || array_to_string(s.tags, ' '))
-                @@ plainto_tsquery('english', :query)
-        """)
-
-        result = await db.execute(search_query, {"query": query})
-        rows = result.fetchall()
-
-        spaces = []
-        for row in rows:
-            # Apply tag filter
-            if tags and not any(tag in row.tags for tag in tags):
-                continue
-
-            # Calculate score
-            text_rank = row.rank
-            popularity = math.log(row.member_count + 1)
-            activity = math.log(row.article_count + 1)
+        search_query = _SPACE_SEARCH_SQL_TAGGED if tags else _SPACE_SEARCH_SQL
 
-            score = (text_rank * 100) * 0.9 + (popularity * 10) + (activity * 5)
+        params: Dict[str, Any] = {"query": query, "limit": limit}
+        if tags:
+            params["tags"] = tags
 
-            # Tag match bonus
-            if tags and any(tag in row.tags for tag in tags):
-                score *= 1.5
+        result = await db.stream(search_query, params)
 
-            highlights = SearchService._create_highlights(
-                row.name, row.description or "", query
-            )
+        spaces = []
+        total = 0
+        async for row in result:
+            total = row.total_rows
+            highlights = {"title": row.title_highlight}
+            if row.content_highlight:
+                highlights["content"] = row.content_highlight
 
             spaces.append({
                 "type": "space",
-                "score": score,
+                "score": row.score,
                 "item": {
                     "id": str(row.id),
                     "name": row.name,
@@ -253,42 +420,28 @@ class SearchService:
                 }
             })
 
-        return spaces
+        return spaces, total
 
     @staticmethod
     async def _search_users(
         db: AsyncSession,
         query: str,
-        tags: List[str] | None = None
-    ) -> List[Dict[str, Any]]:
+        tags: List[str] | None = None,
+        limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """Search users by name, bio, and expertise."""
         # Note: User model needs bio and expertise_tags fields added
         # For now, we'll search by display_name and email
-        search_query = text("""
-            SELECT
-                u.id,
-                u.email,
-                u.display_name,
-                u.created_at,
-                ts_rank(
-                    to_tsvector('english', COALESCE(u.display_name, '') || ' ' || u.email),
-                    plainto_tsquery('english', :query)
-                ) as rank
-            FROM users u
-            WHERE to_tsvector('english', COALESCE(u.display_name, '') || ' ' || u.email)
-                @@ plainto_tsquery('english', :query)
-        """)
-
-        result = await db.execute(search_query, {"query": query})
-        rows = result.fetchall()
+        result = await db.stream(_USER_SEARCH_SQL, {"query": query, "limit": limit})
 
         users = []
-        for row in rows:
-            score = row.rank * 100 * 0.8  # Users have lower base relevance
-
+        total = 0
+        async for row in result:
+            total = row.total_rows
+            # Users have lower base relevance; the 0.8 factor is in the SQL
             users.append({
                 "type": "user",
-                "score": score,
+                "score": row.score,
                 "item": {
                     "id": str(row.id),
                     "email": row.email,
@@ -297,56 +450,7 @@ class SearchService:
                 }
             })
 
-        return users
-
-    @staticmethod
-    def _create_highlights(title: str, content: str, query: str) -> Dict[str, str]:
-        """Create highlighted snippets for search results."""
-        highlights = {}
-        query_terms = query.lower().split()
-
-        # Highlight title
-        highlighted_title = title
-        for term in query_terms:
-            if term in title.lower():
-                # Simple case-insensitive replacement
-                import re
-                pattern = re.compile(re.escape(term), re.IGNORECASE)
-                highlighted_title = pattern.sub(f"<mark>{term}</mark>", highlighted_title)
-        highlights["title"] = highlighted_title
-
-        # Highlight content snippet
-        if content:
-            # Find first occurrence of query term
-            content_lower = content.lower()
-            best_pos = len(content)
-            for term in query_terms:
-                pos = content_lower.find(term)
-                if pos != -1 and pos < best_pos:
-                    best_pos = pos
-
-            # Extract snippet around the match
-            if best_pos < len(content):
-                start = max(0, best_pos - 50)
-                end = min(len(content), best_pos + 150)
-                snippet = content[start:end]
-
-                # Add ellipsis if needed
-                if start > 0:
-                    snippet = "..." + snippet
-                if end < len(content):
-                    snippet = snippet + "..."
-
-                # Highlight terms in snippet
-                for term in query_terms:
-                    if term in snippet.lower():
-                        import re
-                        pattern = re.compile(re.escape(term), re.IGNORECASE)
-                        snippet = pattern.sub(f"<mark>{term}</mark>", snippet)
-
-                highlights["content"] = snippet
-
-        return highlights
+        return users, total
 
     @staticmethod
     async def update_search_index(
@@ -367,41 +471,96 @@ class SearchService:
             content: Entity content/description
             tags: Associated tags
         """
-        # Check if index entry exists
-        result = await db.execute(
-            select(SearchIndex).where(
-                and_(
-                    SearchIndex.entity_type == entity_type,
-                    SearchIndex.entity_id == entity_id
-                )
-            )
+        # Single atomic upsert: no SELECT round-trip, no race between
+        # concurrent writers for the same entity
+        stmt = pg_insert(SearchIndex).values(
+            id=uuid4(),
+            entity_type=entity_type,
+            entity_id=entity_id,
+            title=title,
+            content=content,
+            tags=tags,
+        ).on_conflict_do_update(
+            index_elements=["entity_type", "entity_id"],
+            set_={
+                "title": title,
+                "content": content,
+                "tags": tags,
+                "updated_at": func.now(),
+            },
+        )
+        await db.execute(stmt)
+        await db.commit()
+
+        # Cached pages may now be stale
+        _search_cache.clear()
+        _autocomplete_cache.clear()
+
+    @staticmethod
+    async def bulk_update_search_index(
+        db: AsyncSession,
+        entries: List[Dict[str, Any]]
+    ) -> None:
+        """Upsert many search index entries in batched statements.
+
+        For reindex jobs the per-entity commit in update_search_index
+        dominates; here each batch of rows rides one executemany-style
+        upsert and the whole run commits once.
+
+        Args:
+            db: Database session
+            entries: Dicts with entity_type, entity_id, title, content,
+                and tags keys
+        """
+        if not entries:
+            return
+
+        insert_stmt = pg_insert(SearchIndex)
+        upsert = insert_stmt.on_conflict_do_update(
+            index_elements=["entity_type", "entity_id"],
+            set_={
+                "title": insert_stmt.excluded.title,
+                "content": insert_stmt.excluded.content,
+                "tags": insert_stmt.excluded.tags,
+                "updated_at": func.now(),
+            },
         )
-        search_index = result.scalar_one_or_none()
-
-        if search_index:
-            # Update existing entry
-            search_index.title = title
-            search_index.content = content
-            search_index.tags = tags
-            search_index.updated_at = datetime.now(timezone.utc)
-        else:
-            # Create new entry
-            search_index = SearchIndex(
-                entity_type=entity_type,
-                entity_id=entity_id,
-                title=title,
-                content=content,
-                tags=tags
-            )
-            db.add(search_index)
+
+        for start in range(0, len(entries), 500):
+            batch = entries[start:start + 500]
+            await db.execute(upsert, [{"id": uuid4(), **entry} for entry in batch])
 
         await db.commit()
 
+        _search_cache.clear()
+        _autocomplete_cache.clear()
+
+    @staticmethod
+    async def refresh_search_documents() -> None:
+        """Refresh the search_documents materialized view.
+
+        The view unions published articles, public spaces, and users into a
+        single searchable relation. CONCURRENTLY keeps readers unblocked but
+        cannot run inside a transaction, so this uses an autocommit
+        connection. Intended to be triggered periodically or via the admin
+        reindex endpoint.
+        """
+        engine = get_engine()
+        async with engine.connect() as connection:
+            await connection.execution_options(isolation_level="AUTOCOMMIT")
+            await connection.execute(
+                text("REFRESH MATERIALIZED VIEW CONCURRENTLY search_documents")
+            )
+
+        _search_cache.clear()
+        _autocomplete_cache.clear()
+
     @staticmethod
     async def delete_from_search_index(
         db: AsyncSession,
         entity_type: str,
-        entity_id: UUID
+        entity_id: UUID,
+        commit: bool = True
     ) -> None:
         """Remove entity from search index.
 
@@ -409,6 +568,8 @@ class SearchService:
             db: Database session
             entity_type: Type of entity
             entity_id: Entity ID
+            commit: set False when the caller owns the transaction and
+                will commit the delete itself
         """
         from sqlalchemy import delete
         await db.execute(
@@ -419,7 +580,8 @@ class SearchService:
                 )
             )
         )
-        await db.commit()
+        if commit:
+            await db.commit()
 
     @staticmethod
     async def autocomplete(
@@ -440,75 +602,29 @@ class SearchService:
         if len(query) < 2:
             return []
 
-        suggestions = []
-        query_lower = query.lower()
-
-        # Tag suggestions
-        matching_tags = [
-            tag for tag in AI_TAGS
-            if query_lower in tag.lower()
-        ][:3]
-
-        for tag in matching_tags:
-            # Get tag usage count
-            tag_query = text("""
-                SELECT article_count + space_count + user_count as total
-                FROM tag_usage
-                WHERE tag = :tag
-            """)
-            result = await db.execute(tag_query, {"tag": tag})
-            row = result.fetchone()
-            count = row.total if row else 0
-
-            suggestions.append({
-                "type": "tag",
-                "text": tag,
-                "count": count
-            })
+        cache_key = (query.lower(), limit)
+        cached = _autocomplete_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        pattern = f"%{query.lower()}%"
 
-        # Article title suggestions
-        article_query = text("""
-            SELECT title, slug, view_count
-            FROM articles
-            WHERE status = 'published'
-            AND LOWER(title) LIKE :pattern
-            ORDER BY view_count DESC
-            LIMIT :limit
-        """)
+        # One UNION ALL query returns tag, article, and space suggestions
+        # in a single round-trip; a discriminator column keeps the kinds
+        # apart
         result = await db.execute(
-            article_query,
-            {"pattern": f"%{query_lower}%", "limit": limit - len(suggestions)}
+            _AUTOCOMPLETE_SQL, {"pattern": pattern, "limit": limit}
         )
 
+        # Preserve the tag > article > space priority regardless of row
+        # order
+        by_kind: Dict[str, List[Dict[str, Any]]] = {"tag": [], "article": [], "space": []}
         for row in result:
-            suggestions.append({
-                "type": "article",
-                "text": row.title,
-                "slug": row.slug,
-                "count": row.view_count
-            })
-
-        # Space name suggestions
-        if len(suggestions) < limit:
-            space_query = text("""
-                SELECT name, slug, member_count
-                FROM spaces
-                WHERE visibility = 'public'
-                AND LOWER(name) LIKE :pattern
-                ORDER BY member_count DESC
-                LIMIT :limit
-            """)
-            result = await db.execute(
-                space_query,
-                {"pattern": f"%{query_lower}%", "limit": limit - len(suggestions)}
-            )
-
-            for row in result:
-                suggestions.append({
-                    "type": "space",
-                    "text": row.name,
-                    "slug": row.slug,
-                    "count": row.member_count
-                })
-
-        return suggestions[:limit]
\ No newline at end of file
+            suggestion = {"type": row.kind, "text": row.text, "count": row.count}
+            if row.slug is not None:
+                suggestion["slug"] = row.slug
+            by_kind[row.kind].append(suggestion)
+
+        suggestions = (by_kind["tag"] + by_kind["article"] + by_kind["space"])[:limit]
+        _autocomplete_cache.set(cache_key, suggestions)
+        return suggestions
\ No newline at end of file
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import uuid
+from functools import lru_cache
 from typing import Optional
 
 from slugify import slugify
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, bindparam, exists, func, or_, select, text
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from ..models import Activity, Article, Space, SpaceArticle, User, space_members
 from ..schemas import SpaceCreate, SpaceUpdate
@@ -22,6 +24,118 @@ except ImportError:
     SearchService = None
 
 
+# Membership insert and member-count bump fused into one statement; the
+# count only moves when the insert actually happened
+_JOIN_SPACE_SQL = text("""
+    WITH ins AS (
+        INSERT INTO space_members (space_id, user_id, role)
+        VALUES (:space_id, :user_id, :role)
+        ON CONFLICT (space_id, user_id) DO NOTHING
+        RETURNING 1
+    )
+    UPDATE spaces
+    SET member_count = member_count + 1
+    WHERE id = :space_id AND EXISTS (SELECT 1 FROM ins)
+    RETURNING id
+""")
+
+# Membership check, published check, duplicate guard, insert and the
+# article-count bump all in one statement; nothing changes unless the
+# insert actually landed
+_SHARE_ARTICLE_SQL = text("""
+    WITH ins AS (
+        INSERT INTO space_articles (space_id, article_id, added_by, pinned)
+        SELECT :space_id, :article_id, :user_id, false
+        WHERE EXISTS (
+            SELECT 1 FROM space_members
+            WHERE space_id = :space_id AND user_id = :user_id
+        )
+        AND EXISTS (
+            SELECT 1 FROM articles
+            WHERE id = :article_id AND status = 'published'
+        )
+        ON CONFLICT (space_id, article_id) DO NOTHING
+        RETURNING space_id, article_id, added_by, pinned, added_at
+    ),
+    upd AS (
+        UPDATE spaces
+        SET article_count = article_count + 1
+        WHERE id = :space_id AND EXISTS (SELECT 1 FROM ins)
+    )
+    SELECT * FROM ins
+""")
+
+
+@lru_cache(maxsize=16)
+def _list_spaces_stmt(
+    my_spaces: bool, has_user: bool, has_search: bool, has_tags: bool
+):
+    """Build the list_spaces statement for one filter shape.
+
+    The filters only vary by which parameters are present, so the handful
+    of shapes are constructed once and reused with fresh bind values
+    instead of being rebuilt on every request.
+    """
+    query = (
+        select(Space, func.count().over().label("total"))
+        .options(selectinload(Space.owner), raiseload("*"))
+    )
+
+    if my_spaces and has_user:
+        subquery = (
+            select(space_members.c.space_id)
+            .where(space_members.c.user_id == bindparam("user_id"))
+        )
+        query = query.where(Space.id.in_(subquery))
+    elif has_user:
+        member_subquery = (
+            select(space_members.c.space_id)
+            .where(space_members.c.user_id == bindparam("user_id"))
+        )
+        query = query.where(
+            or_(
+                Space.visibility == "public",
+                Space.id.in_(member_subquery)
+            )
+        )
+    else:
+        query = query.where(Space.visibility == "public")
+
+    # One @> predicate covers all tags, so the GIN index is probed once
+    if has_tags:
+        query = query.where(Space.tags.contains(bindparam("tags")))
+
+    if has_search:
+        query = query.where(
+            or_(
+                Space.name.ilike(bindparam("search_term")),
+                Space.description.ilike(bindparam("search_term"))
+            )
+        )
+
+    return (
+        query
+        .order_by(Space.created_at.desc())
+        .offset(bindparam("skip"))
+        .limit(bindparam("page_limit"))
+    )
+
+
+async def _free_slug(db: AsyncSession, base_slug: str) -> str:
+    """Pick the first unused slug for a base in one round-trip."""
+    result = await db.execute(
+        select(Space.slug).where(Space.slug.like(f"{base_slug}%"))
+    )
+    taken = set(result.scalars().all())
+
+    if base_slug not in taken:
+        return base_slug
+    counter = 1
+    while f"{base_slug}-{counter}" in taken:
+        counter += 1
+    return f"{base_slug}-{counter}"
+
+
 class SpaceService:
     @staticmethod
     async def create_space(
@@ -30,33 +144,34 @@ class SpaceService:
         data: SpaceCreate
     ) -> Space:
         """Create space with owner as first member"""
-        # Generate unique slug
+        # Probe every taken slug for this base in one query instead of a
+        # round-trip per collision; the unique index on slug catches races
         base_slug = slugify(data.name)
-        slug = base_slug
-        counter = 1
-
-        while True:
-            existing = await db.execute(
-                select(Space).where(Space.slug == slug)
+        slug = await _free_slug(db, base_slug)
+
+        def build_space(slug: str) -> Space:
+            return Space(
+                name=data.name,
+                slug=slug,
+                description=data.description,
+                tags=data.tags,
+                visibility=data.visibility,
+                owner_id=owner_id,
+                member_count=1,
+                article_count=0
             )
-            if not existing.scalar_one_or_none():
-                break
-            slug = f"{base_slug}-{counter}"
-            counter += 1
-
-        space = Space(
-            name=data.name,
-            slug=slug,
-            description=data.description,
-            tags=data.tags,
-            visibility=data.visibility,
-            owner_id=owner_id,
-            member_count=1,
-            article_count=0
-        )
 
+        space = build_space(slug)
         db.add(space)
-        await db.flush()
+        try:
+            await db.flush()
+        except IntegrityError:
+            # Lost the slug race to a concurrent insert; re-probe and
+            # retry once
+            await db.rollback()
+            space = build_space(await _free_slug(db, base_slug))
+            db.add(space)
+            await db.flush()
 
         # Add owner as first member with owner role
         await db.execute(
@@ -70,10 +185,11 @@ class SpaceService:
         await db.commit()
         await db.refresh(space)
 
-        # Update tag usage for public spaces
+        # Update tag usage for public spaces in one batched statement
         if TagService and space.visibility == "public" and space.tags:
-            for tag in space.tags:
-                await TagService.update_tag_usage(db, tag, "space", delta=1)
+            await TagService.bulk_update_tag_usage(
+                db, [(tag, "space", 1) for tag in space.tags]
+            )
 
         # Update search index for public spaces
         if SearchService and space.visibility == "public":
@@ -87,7 +203,7 @@ class SpaceService:
             )
 
         # Record activity
-        await ActivityService.record_activity(
+        await ActivityService.record_activity_buffered(
             db=db,
             actor_id=owner_id,
             action=ActivityService.SPACE_CREATED,
@@ -111,17 +227,20 @@ class SpaceService:
         if not user_id:
             return False
 
-        # Check if user is member
+        # Check if user is member; EXISTS lets Postgres stop at the first
+        # index hit without materializing the row
         result = await db.execute(
-            select(space_members).where(
-                and_(
-                    space_members.c.space_id == space.id,
-                    space_members.c.user_id == user_id
+            select(
+                exists().where(
+                    and_(
+                        space_members.c.space_id == space.id,
+                        space_members.c.user_id == user_id
+                    )
                 )
             )
         )
 
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar())
 
     @staticmethod
     async def get_member_role(
@@ -150,34 +269,20 @@ class SpaceService:
         role: str = "member"
     ) -> dict:
         """Add user to space"""
-        # Check if already member
-        existing = await SpaceService.get_member_role(db, space_id, user_id)
-        if existing:
-            return {"already_member": True, "role": existing}
-
-        # Add member
-        await db.execute(
-            space_members.insert().values(
-                space_id=space_id,
-                user_id=user_id,
-                role=role
-            )
-        )
-
-        # Update member count
-        await db.execute(
-            select(Space).where(Space.id == space_id).with_for_update()
-        )
-        await db.execute(
-            Space.__table__.update()
-            .where(Space.id == space_id)
-            .values(member_count=Space.member_count + 1)
+        # One statement inserts the membership (if new) and bumps the
+        # member count; nothing is written when the user is already in
+        result = await db.execute(
+            _JOIN_SPACE_SQL,
+            {"space_id": space_id, "user_id": user_id, "role": role}
         )
+        if result.scalar_one_or_none() is None:
+            existing = await SpaceService.get_member_role(db, space_id, user_id)
+            return {"already_member": True, "role": existing}
 
         await db.commit()
 
         # Record activity
-        await ActivityService.record_activity(
+        await ActivityService.record_activity_buffered(
             db=db,
             actor_id=user_id,
             action=ActivityService.SPACE_JOINED,
@@ -225,7 +330,7 @@ class SpaceService:
         await db.commit()
 
         # Record activity
-        await ActivityService.record_activity(
+        await ActivityService.record_activity_buffered(
             db=db,
             actor_id=user_id,
             action=ActivityService.SPACE_LEFT,
@@ -244,48 +349,25 @@ class SpaceService:
         user_id: uuid.UUID
     ) -> SpaceArticle | None:
         """Share article to space"""
-        # Check if user is member
-        role = await SpaceService.get_member_role(db, space_id, user_id)
-        if not role:
-            return None
-
-        # Check if article exists and is published
-        article = await db.get(Article, article_id)
-        if not article or article.status != "published":
-            return None
-
-        # Check if already shared
-        existing = await db.execute(
-            select(SpaceArticle).where(
-                and_(
-                    SpaceArticle.space_id == space_id,
-                    SpaceArticle.article_id == article_id
-                )
-            )
+        # One statement performs the member and published checks, the
+        # insert (skipped when already shared) and the count bump
+        result = await db.execute(
+            _SHARE_ARTICLE_SQL,
+            {"space_id": space_id, "article_id": article_id, "user_id": user_id}
         )
-        if existing.scalar_one_or_none():
+        row = result.one_or_none()
+        if row is None:
             return None
 
-        # Share article
-        space_article = SpaceArticle(
-            space_id=space_id,
-            article_id=article_id,
-            added_by=user_id,
-            pinned=False
-        )
-
-        db.add(space_article)
-
-        # Update article count
-        await db.execute(
-            Space.__table__.update()
-            .where(Space.id == space_id)
-            .values(article_count=Space.article_count + 1)
-        )
-
         await db.commit()
-        await db.refresh(space_article)
 
+        space_article = SpaceArticle(
+            space_id=row.space_id,
+            article_id=row.article_id,
+            added_by=row.added_by,
+            pinned=row.pinned
+        )
+        space_article.added_at = row.added_at
         return space_article
 
     @staticmethod
@@ -327,57 +409,41 @@ class SpaceService:
         my_spaces: bool = False
     ) -> tuple[list[Space], int]:
         """List spaces with filters"""
-        query = select(Space).options(selectinload(Space.owner))
-
-        # Filter by visibility or membership
-        if user_id and my_spaces:
-            # Get user's spaces
-            subquery = (
-                select(space_members.c.space_id)
-                .where(space_members.c.user_id == user_id)
-            )
-            query = query.where(Space.id.in_(subquery))
-        else:
-            # Public spaces + user's private spaces
-            if user_id:
-                member_subquery = (
-                    select(space_members.c.space_id)
-                    .where(space_members.c.user_id == user_id)
-                )
-                query = query.where(
-                    or_(
-                        Space.visibility == "public",
-                        Space.id.in_(member_subquery)
-                    )
-                )
-            else:
-                query = query.where(Space.visibility == "public")
+        # The window count rides along with the page rows, so the filtered
+        # total comes from the same scan instead of a second query.
+        # raiseload turns any future lazy relationship access into a loud
+        # error instead of a silent per-row SELECT. Statement shapes are
+        # prebuilt per filter combination and parameterized per call
+        query = _list_spaces_stmt(
+            my_spaces=bool(user_id and my_spaces),
+            has_user=user_id is not None,
+            has_search=bool(search),
+            has_tags=bool(tags),
+        )
 
-        # Filter by tags
+        params: dict = {"skip": skip, "page_limit": limit}
+        if user_id:
+            params["user_id"] = user_id
         if tags:
-            for tag in tags:
-                query = query.where(Space.tags.contains([tag]))
-
-        # Search
+            params["tags"] = tags
         if search:
-            search_term = f"%{search}%"
-            query = query.where(
-                or_(
-                    Space.name.ilike(search_term),
-                    Space.description.ilike(search_term)
-                )
-            )
-
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination and ordering
-        query = query.order_by(Space.created_at.desc()).offset(skip).limit(limit)
-
-        result = await db.execute(query)
-        spaces = result.scalars().all()
+            params["search_term"] = f"%{search}%"
+
+        # Build the page in one pass over the result rather than holding
+        # the Row list and the Space list in memory at once
+        result = await db.execute(query, params)
+        spaces: list[Space] = []
+        total = 0
+        for space, total in result:
+            spaces.append(space)
+
+        # The window total only rides on returned rows; a page past the
+        # end of the results still has to report the true count
+        if not spaces and skip:
+            row = (
+                await db.execute(query, {**params, "skip": 0, "page_limit": 1})
+            ).first()
+            total = row.total if row else 0
 
         return spaces, total
 
@@ -389,7 +455,7 @@ class SpaceService:
         """Get space by slug"""
         result = await db.execute(
             select(Space)
-            .options(selectinload(Space.owner))
+            .options(selectinload(Space.owner), raiseload("*"))
             .where(Space.slug == slug)
         )
 
@@ -432,24 +498,24 @@ class SpaceService:
         if TagService and original_public != current_public:
             if current_public:  # Now public
                 # Add tag usage for all current tags
-                for tag in current_tags:
-                    await TagService.update_tag_usage(db, tag, "space", delta=1)
+                await TagService.bulk_update_tag_usage(
+                    db, [(tag, "space", 1) for tag in current_tags]
+                )
             else:  # Now private
                 # Remove tag usage for all original tags
-                for tag in original_tags:
-                    await TagService.update_tag_usage(db, tag, "space", delta=-1)
+                await TagService.bulk_update_tag_usage(
+                    db, [(tag, "space", -1) for tag in original_tags]
+                )
 
-        # If tags changed while public
+        # If tags changed while public: no explicit diff needed — the bulk
+        # call nets -1/+1 per tag, so unchanged tags cancel to zero and
+        # only the actual adds and removes touch the database
         elif TagService and current_public:
-            # Remove old tags
-            removed_tags = set(original_tags) - set(current_tags)
-            for tag in removed_tags:
-                await TagService.update_tag_usage(db, tag, "space", delta=-1)
-
-            # Add new tags
-            added_tags = set(current_tags) - set(original_tags)
-            for tag in added_tags:
-                await TagService.update_tag_usage(db, tag, "space", delta=1)
+            await TagService.bulk_update_tag_usage(
+                db,
+                [(tag, "space", -1) for tag in original_tags]
+                + [(tag, "space", 1) for tag in current_tags]
+            )
 
         # Update search index for public spaces
         if SearchService and current_public:
@@ -481,26 +547,28 @@ class SpaceService:
         if not space:
             return False
 
-        # Store state for cleanup
         was_public = space.visibility == "public"
         space_tags = space.tags if space.tags else []
 
-        await db.delete(space)
-        await db.commit()
-
-        # Clean up tag usage and search index
+        # Tag decrements and search-index removal ride the same
+        # transaction as the delete, so a crash in between can't leave
+        # counts or index rows orphaned; members and shared articles go
+        # via ON DELETE CASCADE instead of ORM round-trips
         if was_public:
-            # Remove tag usage
             if TagService:
-                for tag in space_tags:
-                    await TagService.update_tag_usage(db, tag, "space", delta=-1)
+                await TagService.bulk_update_tag_usage(
+                    db, [(tag, "space", -1) for tag in space_tags], commit=False
+                )
 
-            # Remove from search index
             if SearchService:
                 await SearchService.delete_from_search_index(
                     db=db,
                     entity_type="space",
-                    entity_id=space_id
+                    entity_id=space_id,
+                    commit=False
                 )
 
+        await db.delete(space)
+        await db.commit()
+
         return True
\ No newline at end of file
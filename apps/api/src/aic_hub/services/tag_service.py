@@ -2,15 +2,64 @@
 
 from __future__ import annotations
 
-import math
-from datetime import datetime, timedelta, timezone
+import copy
 from typing import List, Tuple
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import and_, bindparam, case, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..constants import AI_TAGS, TAG_DESCRIPTIONS, TAG_RELATIONSHIPS
 from ..models import Article, Space, TagUsage, User
+from ..utils import TTLCache
+
+# Tag listings are read-mostly; a short TTL absorbs the repeated scan +
+# merge while usage writes clear the cache eagerly
+_tag_stats_cache = TTLCache(maxsize=32, ttl=60.0)
+
+# Common variations that should count toward a tag match
+_TAG_VARIATIONS = {
+    "LLMs": ["llm", "language model", "gpt", "claude", "llama"],
+    "RAG": ["retrieval augmented", "retrieval-augmented"],
+    "NLP": ["natural language", "text processing"],
+    "Computer Vision": ["cv", "image", "vision"],
+    "RL": ["reinforcement learning"],
+    "Vector DBs": ["vector database", "vectordb", "embedding database"]
+}
+
+
+def _build_token_index() -> dict[str, list[tuple[str, float]]]:
+    """Map each lowered keyword to the (tag, weight) pairs it scores for.
+
+    Built once at import so suggest_tags does no per-call lowering,
+    splitting, or dict construction; shared keywords (e.g. description
+    words common to several tags) are checked against the text once.
+    """
+    index: dict[str, list[tuple[str, float]]] = {}
+
+    def add(token: str, tag: str, weight: float) -> None:
+        index.setdefault(token, []).append((tag, weight))
+
+    for tag in AI_TAGS:
+        tag_lower = tag.lower()
+        add(tag_lower, tag, 0.5)
+
+        words = tag_lower.split()
+        for word in words:
+            if len(word) > 3:
+                add(word, tag, 0.3 / len(words))
+
+        for word in TAG_DESCRIPTIONS.get(tag, "").lower().split():
+            if len(word) > 4:
+                add(word, tag, 0.1)
+
+        for variant in _TAG_VARIATIONS.get(tag, []):
+            add(variant, tag, 0.4)
+
+    return index
+
+
+_TAG_TOKEN_INDEX = _build_token_index()
 
 
 class TagService:
@@ -31,35 +80,106 @@ class TagService:
             entity_type: Type of entity ('article', 'space', 'user')
             delta: Change amount (1 for add, -1 for remove)
         """
-        if tag not in AI_TAGS:
-            return  # Only track official AI tags
+        # One upsert instead of SELECT-then-mutate; the batched path also
+        # stamps last_used_at with the database clock
+        await TagService.bulk_update_tag_usage(db, [(tag, entity_type, delta)])
 
-        # Get or create tag usage record
-        result = await db.execute(
-            select(TagUsage).where(TagUsage.tag == tag)
-        )
-        tag_usage = result.scalar_one_or_none()
+    @staticmethod
+    async def bulk_update_tag_usage(
+        db: AsyncSession,
+        updates: List[Tuple[str, str, int]],
+        commit: bool = True
+    ) -> None:
+        """Apply many tag usage deltas in batched statements.
 
-        if not tag_usage:
-            tag_usage = TagUsage(tag=tag)
-            db.add(tag_usage)
-
-        # Update appropriate count
-        if entity_type == 'article':
-            tag_usage.article_count = max(0, tag_usage.article_count + delta)
-        elif entity_type == 'space':
-            tag_usage.space_count = max(0, tag_usage.space_count + delta)
-        elif entity_type == 'user':
-            tag_usage.user_count = max(0, tag_usage.user_count + delta)
-
-        # Update last used timestamp if adding
-        if delta > 0:
-            tag_usage.last_used_at = datetime.now(timezone.utc)
-            # Update weekly/monthly counts
-            tag_usage.week_count += 1
-            tag_usage.month_count += 1
+        Collapses the per-tag SELECT + UPDATE + COMMIT round-trips of
+        update_tag_usage: increments ride a single upsert, decrements a
+        single batched UPDATE, and everything commits once.
 
-        await db.commit()
+        Args:
+            db: Database session
+            updates: (tag, entity_type, delta) triples; tags outside the
+                official AI tags are ignored
+            commit: set False when the caller owns the transaction and
+                will commit the deltas itself
+        """
+        # Net out the deltas per tag
+        net: dict[str, dict[str, int]] = {}
+        for tag, entity_type, delta in updates:
+            if tag not in AI_TAGS or entity_type not in ('article', 'space', 'user'):
+                continue
+            counts = net.setdefault(tag, {'article': 0, 'space': 0, 'user': 0})
+            counts[entity_type] += delta
+
+        increments = []
+        decrements = []
+        for tag, counts in net.items():
+            added = sum(delta for delta in counts.values() if delta > 0)
+            if added > 0:
+                increments.append({
+                    'tag': tag,
+                    'article_count': counts['article'],
+                    'space_count': counts['space'],
+                    'user_count': counts['user'],
+                    'week_count': added,
+                    'month_count': added,
+                    # Database clock, not Python's, so rows agree under skew
+                    'last_used_at': func.now(),
+                })
+            elif any(delta < 0 for delta in counts.values()):
+                decrements.append({
+                    'b_tag': tag,
+                    'b_article': counts['article'],
+                    'b_space': counts['space'],
+                    'b_user': counts['user'],
+                })
+
+        if increments:
+            insert_stmt = pg_insert(TagUsage).values(increments)
+            await db.execute(
+                insert_stmt.on_conflict_do_update(
+                    index_elements=['tag'],
+                    set_={
+                        'article_count': func.greatest(
+                            0, TagUsage.article_count + insert_stmt.excluded.article_count
+                        ),
+                        'space_count': func.greatest(
+                            0, TagUsage.space_count + insert_stmt.excluded.space_count
+                        ),
+                        'user_count': func.greatest(
+                            0, TagUsage.user_count + insert_stmt.excluded.user_count
+                        ),
+                        'week_count': TagUsage.week_count + insert_stmt.excluded.week_count,
+                        'month_count': TagUsage.month_count + insert_stmt.excluded.month_count,
+                        'last_used_at': insert_stmt.excluded.last_used_at,
+                    },
+                )
+            )
+
+        if decrements:
+            # Decrements never create rows, so a plain batched UPDATE with
+            # the same clamp-at-zero semantics suffices. Core update: the
+            # ORM refuses bulk executemany with custom WHERE criteria, and
+            # CASE clamps portably where GREATEST would not
+            def clamped(column, param):
+                bumped = column + bindparam(param)
+                return case((bumped < 0, 0), else_=bumped)
+
+            await db.execute(
+                TagUsage.__table__.update()
+                .where(TagUsage.tag == bindparam('b_tag'))
+                .values(
+                    article_count=clamped(TagUsage.article_count, 'b_article'),
+                    space_count=clamped(TagUsage.space_count, 'b_space'),
+                    user_count=clamped(TagUsage.user_count, 'b_user'),
+                ),
+                decrements,
+            )
+
+        if increments or decrements:
+            if commit:
+                await db.commit()
+            _tag_stats_cache.clear()
 
     @staticmethod
     async def calculate_trending_scores(db: AsyncSession) -> None:
@@ -67,41 +187,42 @@ class TagService:
 
         This should be run periodically (e.g., hourly) via a background job.
         """
-        now = datetime.now(timezone.utc)
-        week_ago = now - timedelta(days=7)
-        month_ago = now - timedelta(days=30)
+        # All three factors are row-local arithmetic, so one UPDATE scores
+        # every tag in place instead of loading each row into Python and
+        # flushing an UPDATE per dirty object
+        total_usage = (
+            TagUsage.article_count + TagUsage.space_count + TagUsage.user_count
+        )
 
-        # Get all tag usage records
-        result = await db.execute(select(TagUsage))
-        tag_usages = result.scalars().all()
+        # Week-based recency decay
+        recency_factor = case(
+            (TagUsage.last_used_at.is_(None), 0.0),
+            else_=1.0 / (
+                1.0 + func.extract("epoch", func.now() - TagUsage.last_used_at) / 604800.0
+            ),
+        )
 
-        for tag_usage in tag_usages:
-            # Calculate base score from total usage
-            total_usage = (
-                tag_usage.article_count +
-                tag_usage.space_count +
-                tag_usage.user_count
-            )
+        # Recent usage vs historical, capped at 2x
+        growth_factor = case(
+            (
+                TagUsage.month_count > 0,
+                func.least(
+                    2.0,
+                    TagUsage.week_count / func.greatest(1.0, TagUsage.month_count / 4.0),
+                ),
+            ),
+            else_=0.0,
+        )
 
-            # Calculate recency factor (decay over time)
-            if tag_usage.last_used_at:
-                hours_since_use = (now - tag_usage.last_used_at).total_seconds() / 3600
-                recency_factor = 1 / (1 + hours_since_use / 168)  # Week-based decay
-            else:
-                recency_factor = 0
-
-            # Calculate growth factor (recent usage vs historical)
-            growth_factor = 0
-            if tag_usage.month_count > 0:
-                week_ratio = tag_usage.week_count / max(1, tag_usage.month_count / 4)
-                growth_factor = min(2.0, week_ratio)  # Cap at 2x
-
-            # Combined trending score
-            tag_usage.trending_score = (
-                math.log(total_usage + 1) * 10 +  # Logarithmic base score
-                recency_factor * 30 +  # Recency bonus
-                growth_factor * 20  # Growth bonus
+        await db.execute(
+            update(TagUsage).values(
+                trending_score=(
+                    func.ln(total_usage + 1) * 10 +  # Logarithmic base score
+                    recency_factor * 30 +  # Recency bonus
+                    growth_factor * 20  # Growth bonus
+                )
             )
+        )
 
         await db.commit()
 
@@ -122,6 +243,7 @@ class TagService:
                 update(TagUsage).values(month_count=0, week_count=0)
             )
         await db.commit()
+        _tag_stats_cache.clear()
 
     @staticmethod
     async def get_related_tags(tag: str, limit: int = 5) -> List[str]:
@@ -154,46 +276,16 @@ class TagService:
             List of (tag, confidence) tuples
         """
         text = f"{title} {content}".lower()
-        suggestions = []
 
-        for tag in AI_TAGS:
-            confidence = 0.0
-            tag_lower = tag.lower()
-
-            # Check exact match
-            if tag_lower in text:
-                confidence += 0.5
-
-            # Check individual words for multi-word tags
-            words = tag_lower.split()
-            for word in words:
-                if len(word) > 3 and word in text:  # Skip short words
-                    confidence += 0.3 / len(words)
-
-            # Check description keywords
-            description = TAG_DESCRIPTIONS.get(tag, "").lower()
-            desc_words = description.split()
-            for word in desc_words:
-                if len(word) > 4 and word in text:
-                    confidence += 0.1
-
-            # Special cases for common variations
-            variations = {
-                "LLMs": ["llm", "language model", "gpt", "claude", "llama"],
-                "RAG": ["retrieval augmented", "retrieval-augmented"],
-                "NLP": ["natural language", "text processing"],
-                "Computer Vision": ["cv", "image", "vision"],
-                "RL": ["reinforcement learning"],
-                "Vector DBs": ["vector database", "vectordb", "embedding database"]
-            }
-
-            if tag in variations:
-                for variant in variations[tag]:
-                    if variant in text:
-                        confidence += 0.4
-
-            if confidence > 0:
-                suggestions.append((tag, min(1.0, confidence)))
+        # Each unique keyword is scanned for once; the precomputed index
+        # fans its weight out to every tag it scores for
+        scores: dict[str, float] = {}
+        for token, contributions in _TAG_TOKEN_INDEX.items():
+            if token in text:
+                for tag, weight in contributions:
+                    scores[tag] = scores.get(tag, 0.0) + weight
+
+        suggestions = [(tag, min(1.0, confidence)) for tag, confidence in scores.items()]
 
         # Sort by confidence and return top suggestions
         suggestions.sort(key=lambda x: x[1], reverse=True)
@@ -271,6 +363,12 @@ class TagService:
             category: Filter category ('all', 'with_content', 'with_experts')
             limit: Maximum number of tags to return
         """
+        cache_key = (sort, category, limit)
+        cached = _tag_stats_cache.get(cache_key)
+        if cached is not None:
+            # Deep copy so callers can't mutate the cached entry
+            return copy.deepcopy(cached)
+
         # Build query
         query = select(TagUsage)
 
@@ -353,4 +451,5 @@ class TagService:
         if limit:
             all_tag_stats = all_tag_stats[:limit]
 
+        _tag_stats_cache.set(cache_key, copy.deepcopy(all_tag_stats))
         return all_tag_stats
\ No newline at end of file
@@ -1,5 +1,6 @@
 """Utility functions for AIC Hub."""
 
+from .cache import TTLCache
 from .slug import slugify
 
-__all__ = ["slugify"]
\ No newline at end of file
+__all__ = ["TTLCache", "slugify"]
\ No newline at end of file
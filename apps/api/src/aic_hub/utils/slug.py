@@ -1,12 +1,31 @@
 """Slug generation utilities."""
 
-import re
+from functools import lru_cache
+
 from unidecode import unidecode
 
+# Deletes everything outside [a-z0-9_\s-] in one C-level pass; built
+# once at import. Input is ASCII by the time it is applied, so 128
+# codepoints cover the whole domain
+_SLUG_TABLE = {
+    c: None
+    for c in range(128)
+    if not (
+        'a' <= chr(c) <= 'z'
+        or '0' <= chr(c) <= '9'
+        or chr(c) in '_-'
+        or chr(c).isspace()
+    )
+}
+
 
+@lru_cache(maxsize=4096)
 def slugify(text: str, max_length: int = 50) -> str:
     """Convert text to URL-safe slug.
 
+    Pure and deterministic, so repeat calls for the same title (edits,
+    retries, re-imports) come straight from the memo cache.
+
     Args:
         text: Text to convert to slug
         max_length: Maximum length of slug
@@ -14,10 +33,15 @@ def slugify(text: str, max_length: int = 50) -> str:
     Returns:
         URL-safe slug string
     """
-    # Convert to ASCII
-    text = unidecode(text)
-    # Lowercase and replace non-alphanumeric chars with hyphens
-    text = re.sub(r'[^\w\s-]', '', text).strip().lower()
-    text = re.sub(r'[-\s]+', '-', text)
+    # Convert to ASCII; most titles already are, and skipping the
+    # transliteration pass for them is a several-fold speedup
+    if not text.isascii():
+        text = unidecode(text)
+    # Lowercase, scrub disallowed characters, then join the remaining
+    # words with single dashes; split() also trims the ends
+    text = text.lower().translate(_SLUG_TABLE)
+    text = '-'.join(text.split())
+    while '--' in text:
+        text = text.replace('--', '-')
     # Truncate to max length
-    return text[:max_length].rstrip('-')
\ No newline at end of file
+    return text[:max_length].rstrip('-')
@@ -1,46 +1,109 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
 
 import pytest
+from argon2 import PasswordHasher
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+  AsyncEngine,
+  AsyncSession,
+  async_sessionmaker,
+  create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
 
-from aic_hub import db
+from aic_hub import db, security
 from aic_hub.config import settings
 from aic_hub.main import app
 
 
-@pytest.fixture(autouse=True)
-async def _setup_database(tmp_path) -> AsyncIterator[None]:
-  database_path = tmp_path / "test.db"
-  settings.database_url = f"sqlite+aiosqlite:///{database_path.as_posix()}"
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hashing() -> Iterator[None]:
+  """Hash with Argon2 at library-minimum cost during tests.
+
+  The production parameters spend ~100ms per hash, which dominates the
+  auth-flow tests; the minimum settings keep real hash/verify semantics
+  at a fraction of the cost.
+  """
+  original = security._password_hasher
+  security._password_hasher = PasswordHasher(time_cost=1, memory_cost=8, parallelism=1)
+  yield
+  security._password_hasher = original
+
+
+@pytest.fixture(scope="session")
+async def _database_engine() -> AsyncIterator[AsyncEngine]:
+  """Create the in-memory engine and schema once for the whole run."""
+  settings.database_url = "sqlite+aiosqlite://"
   settings.session_cookie.secure = False
 
-  db._engine = None  # type: ignore[attr-defined]
-  db._SessionLocal = None  # type: ignore[attr-defined]
-  engine = db.get_engine()
+  engine = create_async_engine(
+    "sqlite+aiosqlite://",
+    poolclass=StaticPool,
+    connect_args={"check_same_thread": False},
+  )
+  db._engine = engine  # type: ignore[attr-defined]
 
-  async with engine.begin() as connection:
-    await connection.run_sync(db.Base.metadata.create_all)
+  # pysqlite's implicit transaction handling breaks SAVEPOINT; take over
+  # transaction control as the SQLAlchemy docs prescribe
+  @event.listens_for(engine.sync_engine, "connect")
+  def _do_connect(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
 
-  yield
+  @event.listens_for(engine.sync_engine, "begin")
+  def _do_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
   async with engine.begin() as connection:
-    await connection.run_sync(db.Base.metadata.drop_all)
+    await connection.run_sync(db.Base.metadata.create_all)
+
+  yield engine
 
   await engine.dispose()
   db._engine = None  # type: ignore[attr-defined]
   db._SessionLocal = None  # type: ignore[attr-defined]
 
 
-@pytest.fixture
-async def client() -> AsyncIterator[AsyncClient]:
+@pytest.fixture(autouse=True)
+async def _setup_database(_database_engine: AsyncEngine) -> AsyncIterator[None]:
+  """Wrap each test in a transaction that is rolled back at the end.
+
+  Application sessions join the test's outer transaction via savepoints,
+  so their commits never reach the shared schema and per-test
+  create_all/drop_all is unnecessary.
+  """
+  connection = await _database_engine.connect()
+  transaction = await connection.begin()
+
+  db._SessionLocal = async_sessionmaker(  # type: ignore[attr-defined]
+    bind=connection,
+    expire_on_commit=False,
+    join_transaction_mode="create_savepoint",
+  )
+
+  yield
+
+  db._SessionLocal = None  # type: ignore[attr-defined]
+  await transaction.rollback()
+  await connection.close()
+
+
+@pytest.fixture(scope="session")
+async def _http_client() -> AsyncIterator[AsyncClient]:
+  """One transport and client for the whole run; tests share it."""
   transport = ASGITransport(app=app)
   async with AsyncClient(transport=transport, base_url="http://testserver") as http_client:
     yield http_client
 
 
+@pytest.fixture
+def client(_http_client: AsyncClient) -> AsyncClient:
+  _http_client.cookies.clear()
+  return _http_client
+
+
 @pytest.fixture
 async def session() -> AsyncIterator[AsyncSession]:
   session_factory = db.get_session_factory()
@@ -128,7 +128,16 @@ async def test_github_callback_links_existing_user(
 
   async def fake_fetch(self: GitHubOAuthClient, token: str) -> GitHubProfile:  # pragma: no cover - simple stub
     assert token == "token"
-    return GitHubProfile(id="123", email="oauth@example.com", login="oauth", name="OAuth User")
+    return GitHubProfile(
+      id="123",
+      email="oauth@example.com",
+      login="oauth",
+      name="OAuth User",
+      avatar_url=None,
+      bio=None,
+      company=None,
+      location=None,
+    )
 
   monkeypatch.setattr(GitHubOAuthClient, "exchange_code", fake_exchange)
   monkeypatch.setattr(GitHubOAuthClient, "fetch_profile", fake_fetch)
@@ -162,7 +171,16 @@ async def test_github_callback_creates_user_when_missing(
     return "token-create"
 
   async def fake_fetch(self: GitHubOAuthClient, token: str) -> GitHubProfile:
-    return GitHubProfile(id="456", email="new-oauth@example.com", login="new", name="New OAuth")
+    return GitHubProfile(
+      id="456",
+      email="new-oauth@example.com",
+      login="new",
+      name="New OAuth",
+      avatar_url=None,
+      bio=None,
+      company=None,
+      location=None,
+    )
 
   monkeypatch.setattr(GitHubOAuthClient, "exchange_code", fake_exchange)
   monkeypatch.setattr(GitHubOAuthClient, "fetch_profile", fake_fetch)
@@ -1,9 +1,7 @@
 from __future__ import annotations
 
 import pytest
-from httpx import ASGITransport, AsyncClient
-
-from aic_hub.main import app
+from httpx import AsyncClient
 
 
 @pytest.fixture(autouse=True)
@@ -16,10 +14,8 @@ def _stub_db(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 @pytest.mark.asyncio
-async def test_health_endpoint_returns_ok() -> None:
-  transport = ASGITransport(app=app)
-  async with AsyncClient(transport=transport, base_url="http://testserver") as client:
-    response = await client.get("/health")
+async def test_health_endpoint_returns_ok(client: AsyncClient) -> None:
+  response = await client.get("/health")
 
   assert response.status_code == 200
   assert response.json() == {"status": "ok"}
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from aic_hub.models import TagUsage
+from aic_hub.services.tag_service import TagService
+
+
+@pytest.mark.asyncio
+async def test_bulk_tag_decrement_updates_and_clamps(session: AsyncSession) -> None:
+  session.add(TagUsage(tag="LLMs", article_count=2))
+  await session.commit()
+
+  # Removing a tag decrements its count
+  await TagService.bulk_update_tag_usage(session, [("LLMs", "article", -1)])
+  usage = await session.scalar(select(TagUsage).where(TagUsage.tag == "LLMs"))
+  assert usage is not None
+  assert usage.article_count == 1
+
+  # Decrementing past zero clamps instead of going negative
+  await TagService.bulk_update_tag_usage(session, [("LLMs", "article", -5)])
+  await session.refresh(usage)
+  assert usage.article_count == 0
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from aic_hub.models import User
+
+
+@pytest.mark.asyncio
+async def test_public_profile_and_listing(client: AsyncClient, session: AsyncSession) -> None:
+  session.add_all([
+    User(email="ada@example.com", username="ada", display_name="Ada"),
+    User(email="grace@example.com", username="grace", display_name="Grace"),
+  ])
+  await session.commit()
+
+  # Sequential on purpose: every request nests a savepoint on the one
+  # shared test connection, so concurrent sessions would interleave them
+  profile = await client.get("/users/ada")
+  listing = await client.get("/users")
+  filtered = await client.get("/users", params={"q": "grace"})
+
+  assert profile.status_code == 200
+  assert profile.json()["username"] == "ada"
+  assert "email" not in profile.json()
+
+  assert listing.status_code == 200
+  assert listing.json()["total"] == 2
+
+  assert filtered.status_code == 200
+  assert filtered.json()["total"] == 1
+  assert filtered.json()["users"][0]["username"] == "grace"
+
+  invalid = await client.get("/users", params={"limit": 0})
+  assert invalid.status_code == 422